@@ -1,14 +1,122 @@
 # Personal Library Manager
 # A command-line application to manage a personal book collection
 
+import bisect
 import json
 import os
+import sys
+from collections import Counter
+
+PAGE_SIZE = 20
+
+# Sort orders available in the paged listing
+SORT_KEYS = {
+    "title": lambda book: (book["title"].lower(), book["author"].lower()),
+    "author": lambda book: (book["author"].lower(), book["title"].lower()),
+    "year": lambda book: (year_sort_key(book), book["title"].lower()),
+}
+
+def year_sort_key(book):
+    """Sort numeric years in order, followed by books with a missing or non-numeric year"""
+    try:
+        return (0, int(book.get("year")))
+    except (TypeError, ValueError):
+        return (1, 0)
 
 class LibraryManager:
     def __init__(self):
         self.library = []
         self.filename = "library.txt"
         self.load_library()
+    
+    def reset_statistics(self):
+        """Clear the running statistics counters"""
+        self.read_count = 0
+        self.genre_counts = Counter()
+        self.author_counts = Counter()
+        self.decade_counts = Counter()
+        self.year_counts = Counter()
+        self.oldest_year = None
+        self.newest_year = None
+    
+    def rebuild_statistics(self):
+        """Recompute the running statistics from the whole library"""
+        self.reset_statistics()
+        for book in self.library:
+            self.track_book(book)
+    
+    def book_year(self, book):
+        """Return a book's publication year as a number, or None if it is not usable"""
+        try:
+            return int(book.get("year"))
+        except (TypeError, ValueError):
+            return None
+    
+    def track_book(self, book):
+        """Update the running statistics for a book added to the library"""
+        if book.get("read"):
+            self.read_count += 1
+        self.genre_counts[book.get("genre", "Unknown")] += 1
+        self.author_counts[book.get("author", "Unknown")] += 1
+        
+        # Books saved with a missing or non-numeric year are left out of the year statistics
+        year = self.book_year(book)
+        if year is None:
+            return
+        self.decade_counts[year // 10 * 10] += 1
+        self.year_counts[year] += 1
+        
+        if self.oldest_year is None or year < self.oldest_year:
+            self.oldest_year = year
+        if self.newest_year is None or year > self.newest_year:
+            self.newest_year = year
+    
+    def untrack_book(self, book):
+        """Update the running statistics for a book removed from the library"""
+        if book.get("read"):
+            self.read_count -= 1
+        self.decrement_count(self.genre_counts, book.get("genre", "Unknown"))
+        self.decrement_count(self.author_counts, book.get("author", "Unknown"))
+        
+        year = self.book_year(book)
+        if year is None:
+            return
+        self.decrement_count(self.decade_counts, year // 10 * 10)
+        self.decrement_count(self.year_counts, year)
+        
+        # Only rescan the distinct years when the last book of an extreme year goes
+        if year not in self.year_counts:
+            if year == self.oldest_year:
+                self.oldest_year = min(self.year_counts, default=None)
+            if year == self.newest_year:
+                self.newest_year = max(self.year_counts, default=None)
+    
+    def get_sort_index(self, order):
+        """Return the library sorted by the given order, building the index on first use"""
+        if order not in self.sort_indexes:
+            self.sort_indexes[order] = sorted(self.library, key=SORT_KEYS[order])
+        return self.sort_indexes[order]
+    
+    def index_book(self, book):
+        """Insert a new book into every sort index built so far"""
+        for order, index in self.sort_indexes.items():
+            bisect.insort(index, book, key=SORT_KEYS[order])
+    
+    def unindex_book(self, book):
+        """Remove a book from every sort index built so far"""
+        for order, index in self.sort_indexes.items():
+            key = SORT_KEYS[order]
+            i = bisect.bisect_left(index, key(book), key=key)
+            # Books with equal keys sit next to each other, so find this exact one
+            while index[i] is not book:
+                i += 1
+            del index[i]
+    
+    def decrement_count(self, counter, key):
+        """Decrease a counter entry, dropping it once it reaches zero"""
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
         
     def add_book(self):
         """Add a new book to the library"""
@@ -42,6 +150,8 @@ class LibraryManager:
         }
         
         self.library.append(book)
+        self.track_book(book)
+        self.index_book(book)
         print("Book added successfully!")
     
     def remove_book(self):
@@ -56,6 +166,8 @@ class LibraryManager:
         for i, book in enumerate(self.library):
             if book["title"].lower() == title.lower():
                 del self.library[i]
+                self.untrack_book(book)
+                self.unindex_book(book)
                 print("Book removed successfully!")
                 found = True
                 break
@@ -91,10 +203,7 @@ class LibraryManager:
                 matches.append(book)
         
         if matches:
-            print("\nMatching Books:")
-            for i, book in enumerate(matches, 1):
-                read_status = "Read" if book["read"] else "Unread"
-                print(f"{i}. {book['title']} by {book['author']} ({book['year']}) - {book['genre']} - {read_status}")
+            self.page_books(matches, "Matching Books")
         else:
             print(f"No books found matching that {search_key}.")
     
@@ -104,10 +213,81 @@ class LibraryManager:
             print("Your library is empty.")
             return
             
-        print("\nYour Library:")
-        for i, book in enumerate(self.library, 1):
+        print("Sort by:")
+        print("1. Order added")
+        print("2. Title")
+        print("3. Author")
+        print("4. Year")
+        
+        while True:
+            try:
+                choice = int(input("Enter your choice: "))
+                if choice in [1, 2, 3, 4]:
+                    break
+                print("Please enter a number between 1 and 4.")
+            except ValueError:
+                print("Please enter a number.")
+        
+        if choice == 1:
+            books = self.library
+        else:
+            books = self.get_sort_index(["title", "author", "year"][choice - 2])
+        
+        self.page_books(books, "Your Library")
+    
+    def format_page(self, books, offset, limit):
+        """Format the books from offset up to offset + limit as one block of text"""
+        lines = []
+        for i in range(offset, min(offset + limit, len(books))):
+            book = books[i]
             read_status = "Read" if book["read"] else "Unread"
-            print(f"{i}. {book['title']} by {book['author']} ({book['year']}) - {book['genre']} - {read_status}")
+            lines.append(f"{i + 1}. {book['title']} by {book['author']} ({book['year']}) - {book['genre']} - {read_status}")
+        return "\n".join(lines)
+    
+    def page_books(self, books, heading):
+        """Show a list of books one page at a time"""
+        limit = PAGE_SIZE
+        total_pages = (len(books) + limit - 1) // limit
+        offset = 0
+        
+        while True:
+            end = min(offset + limit, len(books))
+            # After a +N jump the page no longer starts on a page boundary, so show the book range
+            if offset % limit == 0:
+                position = f"page {offset // limit + 1} of {total_pages}, books {offset + 1}-{end} of {len(books)}"
+            else:
+                position = f"books {offset + 1}-{end} of {len(books)}"
+            
+            # Only the current page is formatted, and it is written in a single call
+            sys.stdout.write(f"\n{heading} ({position}):\n")
+            sys.stdout.write(self.format_page(books, offset, limit) + "\n")
+            
+            if total_pages <= 1:
+                return
+            
+            command = input("Enter/n = next, p = previous, page number = jump, +N = start at book N, q = quit: ").strip().lower()
+            if command == "q":
+                return
+            elif command in ["n", ""]:
+                if end < len(books):
+                    offset += limit
+                elif command == "":
+                    # Pressing Enter past the end leaves the listing, like most pagers
+                    return
+                else:
+                    print("You are on the last page.")
+            elif command == "p":
+                if offset > 0:
+                    offset = max(offset - limit, 0)
+                else:
+                    print("You are on the first page.")
+            elif command.startswith("+") and command[1:].isdigit():
+                # Start the page at an exact book number rather than a page boundary
+                offset = min(max(int(command[1:]) - 1, 0), len(books) - 1)
+            elif command.isdigit() and 1 <= int(command) <= total_pages:
+                offset = (int(command) - 1) * limit
+            else:
+                print(f"Please enter n, p, q, +N or a page number between 1 and {total_pages}.")
     
     def display_statistics(self):
         """Display statistics about the library"""
@@ -117,11 +297,26 @@ class LibraryManager:
             print("Your library is empty.")
             return
             
-        read_books = sum(1 for book in self.library if book["read"])
+        read_books = self.read_count
         percent_read = (read_books / total_books) * 100
         
         print(f"\nTotal books: {total_books}")
-        print(f"Percentage read: {percent_read:.1f}%")
+        print(f"Books read: {read_books} ({percent_read:.1f}%)")
+        print(f"Books unread: {total_books - read_books}")
+        print(f"Oldest publication year: {self.oldest_year}")
+        print(f"Newest publication year: {self.newest_year}")
+        
+        print("\nTop genres:")
+        for genre, count in self.genre_counts.most_common(5):
+            print(f"  {genre}: {count}")
+        
+        print("\nTop authors:")
+        for author, count in self.author_counts.most_common(5):
+            print(f"  {author}: {count}")
+        
+        print("\nBooks by decade:")
+        for decade in sorted(self.decade_counts):
+            print(f"  {decade}s: {self.decade_counts[decade]}")
     
     def save_library(self):
         """Save the library to a file"""
@@ -145,6 +340,10 @@ class LibraryManager:
         else:
             print("No saved library found. Starting with an empty library.")
             self.library = []
+        
+        # Derived data is rebuilt outside the file read so a bad record can never empty the library
+        self.rebuild_statistics()
+        self.sort_indexes = {}
     
     def display_menu(self):
         """Display the main menu"""